@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime
 from typing import Dict, Optional
 
 from ..schemas import ModuleEvent, ModuleType, SessionMetadata, SessionState
@@ -8,10 +11,42 @@ from ..services.event_bus import event_bus
 from ..services.telemetry import telemetry
 from ..utils.logging import get_logger
 
+MAX_SESSIONS = 1024
+
+# Lifecycle broadcasts only differ by session and timestamp; copying a
+# validated template skips re-validating the static fields.
+_SESSION_CREATED = ModuleEvent(
+    session_id="",
+    source=ModuleType.CONTROLLER,
+    target="broadcast",
+    payload={"event": "session_created"},
+)
+_SESSION_CLOSED = ModuleEvent(
+    session_id="",
+    source=ModuleType.CONTROLLER,
+    target="broadcast",
+    payload={"event": "session_closed"},
+)
+
+
+def _lifecycle_event(template: ModuleEvent, session_id: str) -> ModuleEvent:
+    # model_copy is shallow; give each event its own payload so subscribers that
+    # mutate it cannot leak into the template
+    return template.model_copy(
+        update={
+            "session_id": session_id,
+            "payload": dict(template.payload),
+            "created_at": datetime.utcnow(),
+        }
+    )
+
 
 class SessionController:
-    def __init__(self) -> None:
+    def __init__(self, max_sessions: int = MAX_SESSIONS) -> None:
         self._sessions: Dict[str, SessionState] = {}
+        # finalized session ids, oldest first; these are evicted once the map is full
+        self._closed: OrderedDict[str, None] = OrderedDict()
+        self._max_sessions = max_sessions
         self._lock = asyncio.Lock()
         self._logger = get_logger("session_controller")
 
@@ -21,33 +56,43 @@ class SessionController:
                 raise ValueError(f"session {metadata.session_id} already exists")
             state = SessionState(metadata=metadata)
             self._sessions[metadata.session_id] = state
+            self._evict_closed()
+        if self._logger.isEnabledFor(logging.INFO):
             self._logger.info(
                 "session_created",
                 extra={"extra_data": {"session_id": metadata.session_id, "intent": metadata.intent}},
             )
-            await telemetry.increment("sessions.created")
-            await event_bus.publish(
-                ModuleEvent(
-                    session_id=metadata.session_id,
-                    source=ModuleType.CONTROLLER,
-                    target="broadcast",
-                    payload={"event": "session_created"},
-                )
-            )
-            return state
+        await telemetry.increment("sessions.created")
+        await event_bus.publish(_lifecycle_event(_SESSION_CREATED, metadata.session_id))
+        return state
+
+    def _evict_closed(self) -> None:
+        while len(self._sessions) > self._max_sessions and self._closed:
+            session_id, _ = self._closed.popitem(last=False)
+            self._sessions.pop(session_id, None)
+
+    def get_nowait(self, session_id: str) -> Optional[SessionState]:
+        # dict reads are atomic; only create/finalize need the lock
+        return self._sessions.get(session_id)
 
     async def get(self, session_id: str) -> Optional[SessionState]:
-        async with self._lock:
-            return self._sessions.get(session_id)
+        return self.get_nowait(session_id)
 
     async def dispatch(self, event: ModuleEvent) -> None:
-        session = await self.get(event.session_id)
+        session = self.get_nowait(event.session_id)
         if not session or not session.active:
             raise ValueError(f"session {event.session_id} is not active")
-        self._logger.info(
-            "session_dispatch",
-            extra={"extra_data": {"session_id": event.session_id, "source": event.source, "target": event.target}},
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "session_dispatch",
+                extra={
+                    "extra_data": {
+                        "session_id": event.session_id,
+                        "source": event.source,
+                        "target": event.target,
+                    }
+                },
+            )
         await event_bus.publish(event)
 
     async def finalize(self, session_id: str) -> SessionState:
@@ -56,14 +101,10 @@ class SessionController:
             if not state:
                 raise ValueError(f"session {session_id} does not exist")
             state.active = False
+            self._closed[session_id] = None
+            self._closed.move_to_end(session_id)
+        if self._logger.isEnabledFor(logging.INFO):
             self._logger.info("session_finalized", extra={"extra_data": {"session_id": session_id}})
-            await telemetry.increment("sessions.closed")
-            await event_bus.publish(
-                ModuleEvent(
-                    session_id=session_id,
-                    source=ModuleType.CONTROLLER,
-                    target="broadcast",
-                    payload={"event": "session_closed"},
-                )
-            )
-            return state
+        await telemetry.increment("sessions.closed")
+        await event_bus.publish(_lifecycle_event(_SESSION_CLOSED, session_id))
+        return state
@@ -13,3 +13,8 @@ app.include_router(router)
 async def startup() -> None:
     configure_logging()
     await hub.initialize()
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    await hub.shutdown()
@@ -15,6 +15,13 @@ from ..utils.text import normalize_text
 from ..services.telemetry import telemetry
 from ..utils.logging import get_logger
 
+_MAJOR_PHRASING = ("C4:quarter", "E4:eighth", "G4:quarter", "B4:quarter", "C5:half")
+_MINOR_PHRASING = ("A3:quarter", "C4:eighth", "E4:quarter", "G4:quarter", "A4:half")
+_SECTIONS = ("Intro", "Verse", "Pre-Chorus", "Chorus", "Bridge", "Outro")
+_MOTIFS = ("Rhythm Swell", "Tonal Bloom", "Dynamic Surge", "Call and Response")
+_ANCHORS = ("nebula", "rainstorm", "heartbeat", "lighthouse")
+_PADDING = ("frequency", "light")
+
 
 class ImaginationEngine:
     def __init__(self) -> None:
@@ -37,27 +44,24 @@ class ImaginationEngine:
         }
         self._logger = get_logger("module.imagination")
 
-    def _lyric_payload(self, prompt: str, mood: str) -> Dict[str, List[str]]:
-        base = normalize_text(prompt).title()
+    def _lyric_payload(self, normalized_prompt: str, mood: str) -> Dict[str, List[str]]:
+        base = normalized_prompt.title()
         options = self._seed_phrases.get(mood, self._seed_phrases["uplifting"])
         lines = random.sample(options, k=min(3, len(options)))
         return {"prompt": base, "lines": lines}
 
-    def _melody_payload(self, tempo: float | None, key: str | None) -> Dict[str, List[str]]:
+    def _melody_payload(self, tempo: float | None, key: str | None) -> Dict[str, object]:
         scale = key or "Cmaj"
         tempo_val = tempo or 120.0
-        notes = ["C4", "E4", "G4", "B4", "C5"] if "maj" in scale.lower() else ["A3", "C4", "E4", "G4", "A4"]
-        durations = ["quarter", "eighth", "quarter", "quarter", "half"]
-        phrasing = [f"{note}:{duration}" for note, duration in zip(notes, durations)]
+        phrasing = _MAJOR_PHRASING if "maj" in scale.lower() else _MINOR_PHRASING
         return {"tempo": tempo_val, "key": scale, "phrasing": phrasing}
 
-    def _metaphor_payload(self, prompt: str) -> Dict[str, str]:
-        normalized = normalize_text(prompt)
-        elements = normalized.split()
+    def _metaphor_payload(self, normalized_prompt: str) -> Dict[str, str]:
+        elements = normalized_prompt.split()
         if len(elements) < 2:
-            elements.extend(["frequency", "light"])
+            elements.extend(_PADDING)
         subject = random.choice(elements)
-        anchor = random.choice(["nebula", "rainstorm", "heartbeat", "lighthouse"])
+        anchor = random.choice(_ANCHORS)
         metaphor = f"{subject.title()} as a {anchor}"
         explanation = (
             f"The metaphor ties {subject} to {anchor}, conveying evolving resonance and dynamic contrast."
@@ -65,21 +69,21 @@ class ImaginationEngine:
         return {"metaphor": metaphor, "explanation": explanation}
 
     def _structure_payload(self) -> Dict[str, List[str]]:
-        sections = ["Intro", "Verse", "Pre-Chorus", "Chorus", "Bridge", "Outro"]
-        motifs = ["Rhythm Swell", "Tonal Bloom", "Dynamic Surge", "Call and Response"]
-        structure = [f"{section}: {random.choice(motifs)}" for section in sections]
+        motifs = random.choices(_MOTIFS, k=len(_SECTIONS))
+        structure = [f"{section}: {motif}" for section, motif in zip(_SECTIONS, motifs)]
         return {"structure": structure}
 
     async def generate(self, request: GenerationRequest) -> GenerationBundle:
         mood = "uplifting"
+        prompt = normalize_text(request.prompt)
         outputs: List[GeneratedItem] = []
         for mode in request.modes:
             if mode == "lyric":
-                payload = self._lyric_payload(request.prompt, mood)
+                payload = self._lyric_payload(prompt, mood)
             elif mode == "melody":
                 payload = self._melody_payload(request.tempo, request.key)
             elif mode == "metaphor":
-                payload = self._metaphor_payload(request.prompt)
+                payload = self._metaphor_payload(prompt)
             else:
                 payload = self._structure_payload()
             outputs.append(
@@ -30,7 +30,7 @@ class LanguageLyricModule:
                 Syllable(text=data.text, stress=data.stress, phonemes=data.phonemes)
                 for data in analysis["syllables"]
             ]
-            if line.endswith("ing") and not line.lower().startswith("sing"):
+            if line.endswith("ing") and line[:4].lower() != "sing":
                 grammar_notes.append(f"Consider varying gerund ending in: \"{line}\"")
             insights.append(
                 LyricLineInsight(
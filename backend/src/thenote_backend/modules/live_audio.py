@@ -1,29 +1,40 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Callable
+import inspect
+from typing import Awaitable, Callable
 
 from ..schemas import AudioFrame, ModuleEvent, ModuleType
 from ..services.event_bus import event_bus
 from ..services.telemetry import telemetry
 from ..utils.logging import get_logger
 
+AudioListener = Callable[[AudioFrame], Awaitable[None] | None]
+
 
 class LiveAudioInput:
     def __init__(self) -> None:
         self._lock = asyncio.Lock()
-        self._listeners: list[Callable[[AudioFrame], None]] = []
+        # replaced wholesale on register so ingest can read it without the lock
+        self._listeners: tuple[AudioListener, ...] = ()
         self._logger = get_logger("module.live_audio")
 
-    async def register_listener(self, listener: Callable[[AudioFrame], None]) -> None:
+    async def register_listener(self, listener: AudioListener) -> None:
         async with self._lock:
-            self._listeners.append(listener)
+            self._listeners = (*self._listeners, listener)
 
     async def ingest(self, frame: AudioFrame) -> AudioFrame:
         frame.compute_levels()
-        async with self._lock:
+        pending: list[asyncio.Future[None]] = []
+        try:
             for listener in self._listeners:
-                listener(frame)
+                result = listener(frame)
+                if inspect.isawaitable(result):
+                    # schedule right away so a later sync listener raising cannot drop it
+                    pending.append(asyncio.ensure_future(result))
+        finally:
+            if pending:
+                await asyncio.gather(*pending)
         self._logger.info(
             "audio_frame_ingested",
             extra={
@@ -1,44 +1,107 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import os
 import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
+import numpy as np
 
 from ..schemas import MemoryProfile, MemoryQuery, MemoryRecord
 from ..services.telemetry import telemetry
 from ..utils.logging import get_logger
 
+_T = TypeVar("_T")
 
 RETENTION_WINDOWS = {
     "30_days": timedelta(days=30),
     "90_days": timedelta(days=90),
     "180_days": timedelta(days=180),
 }
+_RETENTION_SECONDS = {
+    name: int(window.total_seconds()) for name, window in RETENTION_WINDOWS.items()
+}
+
+_INSERT_RECORD = """
+INSERT INTO records (
+    session_id,
+    user_id,
+    consent_token,
+    profile_embedding,
+    context_summary,
+    retention_policy,
+    created_at,
+    created_epoch
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _epoch_seconds(moment: datetime) -> float:
+    # fractional seconds, so records created within the same second keep their order
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
 
 
 def _resolve_db_path() -> Path:
-    base = os.getenv("THE_NOTE_DATA_DIR")
-    target = Path(base) if base else Path(__file__).resolve().parents[2] / ".data"
+    return _prepare_db_path(os.getenv("THE_NOTE_DATA_DIR"))
+
+
+@functools.lru_cache(maxsize=8)
+def _prepare_db_path(base: str | None) -> Path:
+    # keyed on THE_NOTE_DATA_DIR so each data directory is resolved and created once
+    target = Path(base).resolve() if base else Path(__file__).resolve().parents[2] / ".data"
     target.mkdir(parents=True, exist_ok=True)
     return target / "memory.sqlite3"
 
 
 class AdaptiveMemory:
     def __init__(self) -> None:
-        self._lock = asyncio.Lock()
         self._logger = get_logger("module.adaptive_memory")
         self._db_path = _resolve_db_path()
-        self._initialize_database()
+        # one long-lived connection, opened on demand and only touched from the single
+        # worker thread, so a cancelled caller can never overlap the next one's transaction
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="adaptive-memory")
+        self._executor.submit(self._initialize_database).result()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if sys.platform != "darwin":
+            # memory-mapped reads; left off on macOS where mmap and fsync barriers interact poorly
+            conn.execute("PRAGMA mmap_size=268435456")
         return conn
 
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = self._open()
+        return self._conn
+
+    def _close_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def close(self) -> None:
+        # queued behind any in-flight work so the connection is never closed under it
+        await self._run(self._close_connection)
+
+    async def _run(self, func: Callable[..., _T], *args: Any) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
     def _initialize_database(self) -> None:
         with self._connect() as conn:
             conn.execute(
@@ -48,23 +111,44 @@ class AdaptiveMemory:
                     session_id TEXT NOT NULL,
                     user_id TEXT NOT NULL,
                     consent_token TEXT NOT NULL,
-                    profile_embedding TEXT NOT NULL,
+                    profile_embedding BLOB NOT NULL,
                     context_summary TEXT NOT NULL,
                     retention_policy TEXT NOT NULL,
-                    created_at TEXT NOT NULL
+                    created_at TEXT NOT NULL,
+                    created_epoch REAL
                 )
                 """
             )
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(records)")}
+            if "created_epoch" not in columns:
+                conn.execute("ALTER TABLE records ADD COLUMN created_epoch REAL")
+            # rows from before the epoch column (or an interrupted backfill): derive it
+            # from created_at on every open so they still prune and sort correctly;
+            # julianday resolves milliseconds, so round to that
+            conn.execute(
+                """
+                UPDATE records
+                SET created_epoch = round((julianday(created_at) - 2440587.5) * 86400.0, 3)
+                WHERE created_epoch IS NULL
+                """
+            )
             conn.execute("CREATE INDEX IF NOT EXISTS idx_records_user ON records(user_id)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_records_user_created "
+                "ON records(user_id, created_epoch)"
+            )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_records_session ON records(session_id)"
             )
 
-    def _serialize_embedding(self, embedding: Sequence[float]) -> str:
-        return json.dumps(list(embedding))
+    def _serialize_embedding(self, embedding: Sequence[float]) -> bytes:
+        return np.asarray(embedding, dtype=np.float32).tobytes()
 
-    def _deserialize_embedding(self, payload: str) -> List[float]:
-        return [float(value) for value in json.loads(payload)]
+    def _deserialize_embedding(self, payload: bytes | str) -> np.ndarray:
+        if isinstance(payload, str):
+            # rows written before embeddings were stored as float32 blobs
+            return np.asarray(json.loads(payload), dtype=np.float32)
+        return np.frombuffer(payload, dtype=np.float32)
 
     def _prune_retention(
         self, conn: sqlite3.Connection, user_id: str, retention_policy: str
@@ -72,42 +156,45 @@ class AdaptiveMemory:
         if retention_policy == "session_only":
             conn.execute("DELETE FROM records WHERE user_id = ? AND retention_policy = ?", (user_id, retention_policy))
             return
-        if retention_policy in RETENTION_WINDOWS:
-            window = RETENTION_WINDOWS[retention_policy]
-        else:
-            window = RETENTION_WINDOWS["90_days"]
-        threshold = (datetime.now(timezone.utc) - window).isoformat()
+        window = _RETENTION_SECONDS.get(retention_policy, _RETENTION_SECONDS["90_days"])
+        threshold = int(time.time()) - window
         conn.execute(
-            "DELETE FROM records WHERE user_id = ? AND created_at < ?",
+            "DELETE FROM records WHERE user_id = ? AND created_epoch < ?",
             (user_id, threshold),
         )
 
-    async def upsert(self, record: MemoryRecord) -> None:
-        async with self._lock:
-            with self._connect() as conn:
+    def _record_params(self, record: MemoryRecord) -> tuple:
+        return (
+            record.session_id,
+            record.user_id,
+            record.consent_token,
+            self._serialize_embedding(record.profile_embedding),
+            record.context_summary,
+            record.retention_policy,
+            record.created_at,
+            _epoch_seconds(record.created_at),
+        )
+
+    def _write_records(self, records: Sequence[MemoryRecord], params: List[tuple]) -> None:
+        # prune before each insert, exactly as sequential upserts would, but in one transaction
+        with self._connect() as conn:
+            for record, record_params in zip(records, params):
                 self._prune_retention(conn, record.user_id, record.retention_policy)
-                conn.execute(
-                    """
-                    INSERT INTO records (
-                        session_id,
-                        user_id,
-                        consent_token,
-                        profile_embedding,
-                        context_summary,
-                        retention_policy,
-                        created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record.session_id,
-                        record.user_id,
-                        record.consent_token,
-                        self._serialize_embedding(record.profile_embedding),
-                        record.context_summary,
-                        record.retention_policy,
-                        record.created_at,
-                    ),
-                )
+                conn.execute(_INSERT_RECORD, record_params)
+
+    def _fetch_rows(self, sql: str, params: tuple) -> List[sqlite3.Row]:
+        with self._connect() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    async def upsert(self, record: MemoryRecord) -> None:
+        await self.upsert_many([record])
+
+    async def upsert_many(self, records: Sequence[MemoryRecord]) -> None:
+        if not records:
+            return
+        params = [self._record_params(record) for record in records]
+        await self._run(self._write_records, records, params)
+        for record in records:
             self._logger.info(
                 "memory_upserted",
                 extra={
@@ -118,62 +205,59 @@ class AdaptiveMemory:
                     }
                 },
             )
-            await telemetry.increment("memory.upserts")
+        await telemetry.increment("memory.upserts", len(records))
 
     async def fetch_profile(self, query: MemoryQuery) -> Optional[MemoryProfile]:
-        async with self._lock:
-            with self._connect() as conn:
-                rows = conn.execute(
-                    """
-                    SELECT profile_embedding, retention_policy
-                    FROM records
-                    WHERE user_id = ?
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                    """,
-                    (query.user_id, query.limit),
-                ).fetchall()
+        rows = await self._run(
+            self._fetch_rows,
+            """
+            SELECT profile_embedding, retention_policy
+            FROM records
+            WHERE user_id = ?
+            ORDER BY created_epoch DESC, id DESC
+            LIMIT ?
+            """,
+            (query.user_id, query.limit),
+        )
         if not rows:
             return None
-        embeddings = [self._deserialize_embedding(row["profile_embedding"]) for row in rows]
-        if not embeddings or not embeddings[0]:
-            averaged: List[float] = []
-        else:
-            length = len(embeddings[0])
-            sums = [0.0] * length
-            for vector in embeddings:
-                for idx, value in enumerate(vector):
-                    sums[idx] += value
-            averaged = [total / len(embeddings) for total in sums]
+        embeddings = np.vstack(
+            [self._deserialize_embedding(row["profile_embedding"]) for row in rows]
+        )
+        averaged: List[float] = embeddings.mean(axis=0).tolist() if embeddings.size else []
         preferences = {"retention_policy": rows[0]["retention_policy"]}
         return MemoryProfile(user_id=query.user_id, preferences=preferences, embeddings=averaged)
 
+    def _record_row(self, cursor: sqlite3.Cursor, row: Any) -> MemoryRecord:
+        session_id, user_id, consent_token, embedding, summary, retention_policy, created_at = row
+        return MemoryRecord(
+            session_id=session_id,
+            user_id=user_id,
+            consent_token=consent_token,
+            profile_embedding=self._deserialize_embedding(embedding).tolist(),
+            context_summary=summary,
+            retention_policy=retention_policy,
+            created_at=created_at,
+        )
+
+    def _fetch_records(self, user_id: str, limit: int) -> List[MemoryRecord]:
+        cursor = self._connect().cursor()
+        # map rows straight to records instead of materializing sqlite3.Row objects first
+        cursor.row_factory = self._record_row
+        cursor.execute(
+            """
+            SELECT session_id, user_id, consent_token, profile_embedding, context_summary,
+                   retention_policy, created_at
+            FROM records
+            WHERE user_id = ?
+            ORDER BY created_epoch DESC, id DESC
+            LIMIT ?
+            """,
+            (user_id, limit),
+        )
+        return list(cursor)
+
     async def list_recent(self, query: MemoryQuery) -> List[MemoryRecord]:
-        async with self._lock:
-            with self._connect() as conn:
-                rows = conn.execute(
-                    """
-                    SELECT session_id, user_id, consent_token, profile_embedding, context_summary,
-                           retention_policy, created_at
-                    FROM records
-                    WHERE user_id = ?
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                    """,
-                    (query.user_id, query.limit),
-                ).fetchall()
+        records = await self._run(self._fetch_records, query.user_id, query.limit)
         await telemetry.increment("memory.queries")
-        records: List[MemoryRecord] = []
-        for row in rows:
-            records.append(
-                MemoryRecord(
-                    session_id=row["session_id"],
-                    user_id=row["user_id"],
-                    consent_token=row["consent_token"],
-                    profile_embedding=self._deserialize_embedding(row["profile_embedding"]),
-                    context_summary=row["context_summary"],
-                    retention_policy=row["retention_policy"],
-                    created_at=row["created_at"],
-                )
-            )
         return records
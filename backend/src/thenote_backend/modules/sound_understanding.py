@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import time
+from collections import OrderedDict
 from typing import Optional
 
 import numpy as np
@@ -18,19 +20,55 @@ from ..utils.audio import (
     estimate_emotion,
 )
 
+# below this many samples per channel, thread hand-off costs more than the analysis itself
+_INLINE_ANALYSIS_SAMPLES = 1 << 14
+MAX_FRAMES_PER_SESSION = 1024
+
+
+def _max_frames_from_env() -> int:
+    raw = os.getenv("THE_NOTE_ANALYSIS_CACHE")
+    if raw is None:
+        return MAX_FRAMES_PER_SESSION
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        get_logger("module.sound_understanding").warning(
+            "invalid_analysis_cache_size",
+            extra={"extra_data": {"value": raw, "fallback": MAX_FRAMES_PER_SESSION}},
+        )
+        return MAX_FRAMES_PER_SESSION
+    return value
+
 
 class SoundUnderstandingEngine:
-    def __init__(self) -> None:
+    def __init__(self, max_frames: int | None = None) -> None:
+        if max_frames is None:
+            max_frames = _max_frames_from_env()
+        if max_frames < 1:
+            raise ValueError(f"max_frames must be at least 1, got {max_frames}")
         self._lock = asyncio.Lock()
-        self._store: dict[str, dict[str, AnalysisFrame]] = {}
+        # per-session analyses, oldest first; the oldest is dropped once a session is full
+        self._store: dict[str, OrderedDict[str, AnalysisFrame]] = {}
+        self._max_frames = max_frames
         self._logger = get_logger("module.sound_understanding")
 
     async def analyze_frame(self, frame: AudioFrame) -> AnalysisFrame:
         start = time.perf_counter()
         waveform = frame.decode_waveform()
-        pitch = detect_pitch(waveform, frame.sample_rate)
-        rhythm = detect_rhythm(waveform, frame.sample_rate)
-        spectrum = compute_spectral_energy(waveform, frame.sample_rate)
+        if waveform.shape[0] < _INLINE_ANALYSIS_SAMPLES:
+            pitch = detect_pitch(waveform, frame.sample_rate)
+            rhythm = detect_rhythm(waveform, frame.sample_rate)
+            spectrum = compute_spectral_energy(waveform, frame.sample_rate)
+        else:
+            # long frames take tens of ms (pitch autocorrelation is quadratic); run the
+            # independent analyzers off the event loop
+            pitch, rhythm, spectrum = await asyncio.gather(
+                asyncio.to_thread(detect_pitch, waveform, frame.sample_rate),
+                asyncio.to_thread(detect_rhythm, waveform, frame.sample_rate),
+                asyncio.to_thread(compute_spectral_energy, waveform, frame.sample_rate),
+            )
         emotion = estimate_emotion(pitch, rhythm)
         timbre = compute_timbre(spectrum)
         analysis = AnalysisFrame(
@@ -43,8 +81,11 @@ class SoundUnderstandingEngine:
             timbre=timbre,
         )
         async with self._lock:
-            session_store = self._store.setdefault(frame.session_id, {})
+            session_store = self._store.setdefault(frame.session_id, OrderedDict())
             session_store[frame.frame_id] = analysis
+            session_store.move_to_end(frame.frame_id)
+            while len(session_store) > self._max_frames:
+                session_store.popitem(last=False)
         elapsed_ms = (time.perf_counter() - start) * 1000
         self._logger.info(
             "analysis_completed",
@@ -82,4 +123,5 @@ class SoundUnderstandingEngine:
 
     async def get_analysis(self, session_id: str, frame_id: str) -> Optional[AnalysisFrame]:
         async with self._lock:
-            return self._store.get(session_id, {}).get(frame_id)
+            store = self._store.get(session_id)
+            return store.get(frame_id) if store else None
@@ -14,6 +14,8 @@ from ..utils.audio import checksum_audio
 from ..services.telemetry import telemetry
 from ..utils.logging import get_logger
 
+_PHASE_BLOCK_SAMPLES = 1 << 21
+
 
 class VoicePerformanceSynth:
     def __init__(self) -> None:
@@ -37,10 +39,14 @@ class VoicePerformanceSynth:
         duration = max(1.2, len(frequencies) * 0.08)
         t = np.linspace(0, duration, int(self.sample_rate * duration), endpoint=False)
         waveform = np.zeros_like(t)
-        envelope = np.linspace(0.8, 0.2, len(frequencies))
-        for idx, freq in enumerate(frequencies):
-            amp = amplitudes[idx] * envelope[idx % len(envelope)]
-            waveform += amp * np.sin(2 * np.pi * freq * t)
+        omegas = 2 * np.pi * frequencies
+        weights = amplitudes * np.linspace(0.8, 0.2, len(frequencies))
+        # sin over a (partial x sample) phase grid mixed down by matmul, in blocks of
+        # partials so the grid stays around _PHASE_BLOCK_SAMPLES floats
+        step = max(1, _PHASE_BLOCK_SAMPLES // max(1, len(t)))
+        for start in range(0, len(frequencies), step):
+            phases = np.outer(omegas[start : start + step], t)
+            waveform += weights[start : start + step] @ np.sin(phases, out=phases)
         waveform = np.tanh(waveform)  # soft clipping
         return waveform.astype(np.float32)
 
@@ -49,6 +49,9 @@ class Hub:
         await event_bus.subscribe(ModuleType.SOUND_UNDERSTANDING, self.sound.on_event)
         await event_bus.subscribe("broadcast", self.streamer.broadcast)
 
+    async def shutdown(self) -> None:
+        await self.memory.close()
+
 
 hub = Hub()
 
@@ -67,7 +70,7 @@ async def close_session(session_id: str) -> SessionState:
 async def submit_audio(session_id: str, frame: AudioFrame) -> AudioFrame:
     if frame.session_id != session_id:
         raise HTTPException(status_code=400, detail="session mismatch")
-    state = await hub.sessions.get(session_id)
+    state = hub.sessions.get_nowait(session_id)
     if not state or not state.active:
         raise HTTPException(status_code=404, detail="session inactive")
     return await hub.live_audio.ingest(frame)
@@ -134,7 +137,7 @@ async def get_telemetry() -> dict[str, float]:
 
 @router.websocket("/ws/sessions/{session_id}")
 async def session_stream(websocket: WebSocket, session_id: str) -> None:
-    state = await hub.sessions.get(session_id)
+    state = hub.sessions.get_nowait(session_id)
     if not state or not state.active:
         await websocket.close(code=1008)
         return
@@ -37,8 +37,9 @@ class AudioFrame(BaseModel):
         if data.size == 0:
             raise ValueError("audio frame contains no samples")
         mono = data if data.ndim == 1 else data.mean(axis=1)
-        self.rms = float(math.sqrt(np.mean(np.square(mono))))
-        self.peak = float(np.max(np.abs(mono)))
+        # dot product and min/max avoid materializing squared/abs copies of the frame
+        self.rms = float(math.sqrt(float(np.dot(mono, mono)) / mono.size))
+        self.peak = float(max(mono.max(), -mono.min()))
 
 
 class TranscriptChunk(BaseModel):
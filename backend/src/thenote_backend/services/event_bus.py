@@ -22,12 +22,11 @@ class EventBus:
         key = event.target.value if isinstance(event.target, ModuleType) else event.target
         queue = self._queues[key]
         await queue.put(event)
-        # broadcast to handlers immediately
-        async with self._lock:
-            for handler in self._handlers.get(key, []):
-                await handler(event)
-            for handler in self._handlers.get("broadcast", []):
-                await handler(event)
+        # broadcast to handlers immediately; snapshot the handler lists instead of
+        # holding the lock so handlers can publish follow-up events
+        handlers = [*self._handlers.get(key, ()), *self._handlers.get("broadcast", ())]
+        for handler in handlers:
+            await handler(event)
         self._logger.info(
             "event_published",
             extra={"extra_data": {"session_id": event.session_id, "source": event.source, "target": key}},
@@ -3,11 +3,15 @@ from __future__ import annotations
 import asyncio
 from typing import Dict, Set
 
+import orjson
 from fastapi import WebSocket
 
 from ..schemas.base import ModuleEvent, ModuleType
 from ..utils.logging import get_logger
 
+# match what stdlib json (send_json) accepted: non-str keys and numpy scalars in payloads
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 
 class WebSocketStreamer:
     def __init__(self) -> None:
@@ -34,16 +38,27 @@ class WebSocketStreamer:
             sockets = list(self._connections.get(event.session_id, []))
         if not sockets:
             return
-        payload = {
-            "session_id": event.session_id,
-            "source": event.source,
-            "target": event.target,
-            "payload": event.payload,
-            "created_at": event.created_at.isoformat(),
-        }
+        # serialize once and fan the same frame out to every socket
+        try:
+            message = orjson.dumps(
+                {
+                    "session_id": event.session_id,
+                    "source": event.source,
+                    "target": event.target,
+                    "payload": event.payload,
+                    "created_at": event.created_at.isoformat(),
+                },
+                option=_JSON_OPTIONS,
+            ).decode("utf-8")
+        except TypeError as exc:
+            self._logger.error(
+                "ws_serialize_failed",
+                extra={"extra_data": {"session_id": event.session_id, "error": str(exc)}},
+            )
+            return
         for websocket in sockets:
             try:
-                await websocket.send_json(payload)
+                await websocket.send_text(message)
             except Exception as exc:  # pragma: no cover - network errors
                 self._logger.error(
                     "ws_send_failed",
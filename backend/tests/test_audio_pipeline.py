@@ -1,6 +1,24 @@
+import base64
+
+import numpy as np
+import pytest
 from fastapi.testclient import TestClient
 
 from tests.conftest import generate_sine_frame
+from thenote_backend.modules.live_audio import LiveAudioInput
+from thenote_backend.modules.sound_understanding import (
+    _INLINE_ANALYSIS_SAMPLES,
+    MAX_FRAMES_PER_SESSION,
+    SoundUnderstandingEngine,
+)
+from thenote_backend.schemas import AudioFrame
+from thenote_backend.utils.audio import (
+    compute_spectral_energy,
+    compute_timbre,
+    detect_pitch,
+    detect_rhythm,
+    estimate_emotion,
+)
 
 
 def test_audio_analysis_flow(api_client: TestClient) -> None:
@@ -25,3 +43,84 @@ def test_audio_analysis_flow(api_client: TestClient) -> None:
     assert analysis.status_code == 200
 
     api_client.post(f"/sessions/{session_id}/close")
+
+
+@pytest.mark.asyncio
+async def test_analysis_store_evicts_oldest_frames() -> None:
+    engine = SoundUnderstandingEngine(max_frames=2)
+    frames = [AudioFrame(**generate_sine_frame("session_cache")) for _ in range(3)]
+    for frame in frames:
+        await engine.analyze_frame(frame)
+
+    assert await engine.get_analysis("session_cache", frames[0].frame_id) is None
+    for frame in frames[1:]:
+        assert await engine.get_analysis("session_cache", frame.frame_id) is not None
+
+
+def test_analysis_cache_size_rejects_invalid_values(monkeypatch) -> None:
+    monkeypatch.setenv("THE_NOTE_ANALYSIS_CACHE", "0")
+    assert SoundUnderstandingEngine()._max_frames == MAX_FRAMES_PER_SESSION
+    monkeypatch.setenv("THE_NOTE_ANALYSIS_CACHE", "lots")
+    assert SoundUnderstandingEngine()._max_frames == MAX_FRAMES_PER_SESSION
+    monkeypatch.setenv("THE_NOTE_ANALYSIS_CACHE", "16")
+    assert SoundUnderstandingEngine()._max_frames == 16
+    with pytest.raises(ValueError):
+        SoundUnderstandingEngine(max_frames=0)
+
+
+@pytest.mark.asyncio
+async def test_live_audio_runs_sync_and_async_listeners() -> None:
+    live_audio = LiveAudioInput()
+    seen: list[str] = []
+
+    async def async_listener(frame: AudioFrame) -> None:
+        seen.append(f"async:{frame.frame_id}")
+
+    def failing_listener(frame: AudioFrame) -> None:
+        seen.append(f"sync:{frame.frame_id}")
+        raise RuntimeError("listener failed")
+
+    await live_audio.register_listener(async_listener)
+    await live_audio.register_listener(seen.append)
+    frame = AudioFrame(**generate_sine_frame("session_listeners"))
+    await live_audio.ingest(frame)
+    assert seen == [frame, f"async:{frame.frame_id}"]
+
+    # a raising sync listener must not drop the async listener scheduled before it
+    await live_audio.register_listener(failing_listener)
+    seen.clear()
+    with pytest.raises(RuntimeError):
+        await live_audio.ingest(frame)
+    assert seen == [frame, f"sync:{frame.frame_id}", f"async:{frame.frame_id}"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("channels", [1, 2])
+async def test_long_frames_match_inline_analysis(channels: int) -> None:
+    sample_rate = 8000
+    samples = _INLINE_ANALYSIS_SAMPLES + 256
+    t = np.arange(samples, dtype=np.float32) / sample_rate
+    tone = (0.6 * np.sin(2 * np.pi * 220.0 * t)).astype(np.float32)
+    waveform = np.repeat(tone, channels) if channels > 1 else tone
+    frame = AudioFrame(
+        **{
+            **generate_sine_frame("session_long"),
+            "sample_rate": sample_rate,
+            "channels": channels,
+            "duration_ms": samples / sample_rate * 1000,
+            "waveform_base64": base64.b64encode(waveform.tobytes()).decode("ascii"),
+        }
+    )
+
+    analysis = await SoundUnderstandingEngine().analyze_frame(frame)
+
+    decoded = frame.decode_waveform()
+    assert decoded.shape[0] >= _INLINE_ANALYSIS_SAMPLES
+    pitch = detect_pitch(decoded, sample_rate)
+    rhythm = detect_rhythm(decoded, sample_rate)
+    spectrum = compute_spectral_energy(decoded, sample_rate)
+    assert analysis.pitch == pitch
+    assert analysis.rhythm == rhythm
+    assert list(analysis.spectrum) == list(spectrum)
+    assert analysis.emotion == estimate_emotion(pitch, rhythm)
+    assert analysis.timbre == compute_timbre(spectrum)
@@ -1,4 +1,6 @@
 import asyncio
+import json
+import sqlite3
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -46,3 +48,234 @@ async def test_memory_retention(monkeypatch, tmp_path):
     assert profile.user_id == user_id
     assert profile.preferences["retention_policy"] == "30_days"
     assert profile.embeddings == [0.5, 0.5, 0.5]
+    await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_reads_legacy_json_embeddings(monkeypatch, tmp_path):
+    monkeypatch.setenv("THE_NOTE_DATA_DIR", str(tmp_path))
+    memory = AdaptiveMemory()
+    with sqlite3.connect(tmp_path / "memory.sqlite3") as conn:
+        conn.execute(
+            """
+            INSERT INTO records (
+                session_id, user_id, consent_token, profile_embedding,
+                context_summary, retention_policy, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                "sess_legacy",
+                "artist_legacy",
+                "consent_legacy",
+                json.dumps([0.25, 0.75]),
+                "Legacy snapshot",
+                "90_days",
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+    await memory.upsert(
+        MemoryRecord(
+            session_id="sess_blob",
+            user_id="artist_legacy",
+            consent_token="consent_blob",
+            profile_embedding=[0.75, 0.25],
+            context_summary="Blob snapshot",
+        )
+    )
+
+    profile = await memory.fetch_profile(MemoryQuery(user_id="artist_legacy", limit=5))
+    assert profile is not None
+    assert profile.embeddings == [0.5, 0.5]
+    await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_upsert_many_matches_sequential_upserts(monkeypatch, tmp_path):
+    monkeypatch.setenv("THE_NOTE_DATA_DIR", str(tmp_path))
+    memory = AdaptiveMemory()
+    user_id = "artist_batch"
+    now = datetime.now(timezone.utc)
+
+    def record(session_id: str, retention: str, age_days: int) -> MemoryRecord:
+        return MemoryRecord(
+            session_id=session_id,
+            user_id=user_id,
+            consent_token=f"consent_{session_id}",
+            profile_embedding=[0.1, 0.2],
+            context_summary=session_id,
+            retention_policy=retention,
+            created_at=(now - timedelta(days=age_days)).isoformat(),
+        )
+
+    await memory.upsert_many(
+        [
+            record("sess_stale", "90_days", 60),
+            record("sess_first", "session_only", 0),
+            record("sess_second", "session_only", 0),
+            record("sess_recent", "30_days", 0),
+        ]
+    )
+
+    records = await memory.list_recent(MemoryQuery(user_id=user_id, limit=10))
+    # session_only records replace each other, and the 30-day window drops the stale one
+    assert sorted(record.session_id for record in records) == ["sess_recent", "sess_second"]
+    await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_migrates_pre_epoch_schema(monkeypatch, tmp_path):
+    monkeypatch.setenv("THE_NOTE_DATA_DIR", str(tmp_path))
+    now = datetime.now(timezone.utc)
+    with sqlite3.connect(tmp_path / "memory.sqlite3") as conn:
+        conn.execute(
+            """
+            CREATE TABLE records (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                consent_token TEXT NOT NULL,
+                profile_embedding TEXT NOT NULL,
+                context_summary TEXT NOT NULL,
+                retention_policy TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+        conn.executemany(
+            """
+            INSERT INTO records (
+                session_id, user_id, consent_token, profile_embedding,
+                context_summary, retention_policy, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    f"sess_{age}",
+                    "artist_migrated",
+                    "consent",
+                    json.dumps([0.5, 0.5]),
+                    "Legacy snapshot",
+                    "30_days",
+                    (now - timedelta(days=age)).isoformat(),
+                )
+                for age in (60, 2, 1)
+            ],
+        )
+    conn.close()
+
+    memory = AdaptiveMemory()
+    records = await memory.list_recent(MemoryQuery(user_id="artist_migrated", limit=10))
+    assert [record.session_id for record in records] == ["sess_1", "sess_2", "sess_60"]
+
+    await memory.upsert(
+        MemoryRecord(
+            session_id="sess_0",
+            user_id="artist_migrated",
+            consent_token="consent",
+            profile_embedding=[0.5, 0.5],
+            context_summary="Current snapshot",
+            retention_policy="30_days",
+        )
+    )
+    records = await memory.list_recent(MemoryQuery(user_id="artist_migrated", limit=10))
+    assert [record.session_id for record in records] == ["sess_0", "sess_1", "sess_2"]
+    await memory.close()
+
+    # rows left without an epoch by older writers are backfilled on the next open
+    with sqlite3.connect(tmp_path / "memory.sqlite3") as conn:
+        conn.execute(
+            """
+            INSERT INTO records (
+                session_id, user_id, consent_token, profile_embedding,
+                context_summary, retention_policy, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                "sess_45",
+                "artist_migrated",
+                "consent",
+                json.dumps([0.5, 0.5]),
+                "Unmigrated snapshot",
+                "30_days",
+                (now - timedelta(days=45)).isoformat(),
+            ),
+        )
+    conn.close()
+
+    memory = AdaptiveMemory()
+    records = await memory.list_recent(MemoryQuery(user_id="artist_migrated", limit=10))
+    assert [record.session_id for record in records][-1] == "sess_45"
+    await memory.upsert(
+        MemoryRecord(
+            session_id="sess_now",
+            user_id="artist_migrated",
+            consent_token="consent",
+            profile_embedding=[0.5, 0.5],
+            context_summary="Current snapshot",
+            retention_policy="30_days",
+        )
+    )
+    records = await memory.list_recent(MemoryQuery(user_id="artist_migrated", limit=10))
+    assert "sess_45" not in {record.session_id for record in records}
+    await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_orders_records_within_the_same_second(monkeypatch, tmp_path):
+    monkeypatch.setenv("THE_NOTE_DATA_DIR", str(tmp_path))
+    memory = AdaptiveMemory()
+    later = datetime.now(timezone.utc).replace(microsecond=600_000)
+    earlier = later - timedelta(seconds=0.4)
+
+    for session_id, retention, created_at in (
+        ("later", "30_days", later),
+        ("earlier", "90_days", earlier),
+    ):
+        await memory.upsert(
+            MemoryRecord(
+                session_id=session_id,
+                user_id="artist_same_second",
+                consent_token="consent",
+                profile_embedding=[0.5, 0.5],
+                context_summary=session_id,
+                retention_policy=retention,
+                created_at=created_at,
+            )
+        )
+
+    query = MemoryQuery(user_id="artist_same_second", limit=10)
+    records = await memory.list_recent(query)
+    assert [record.session_id for record in records] == ["later", "earlier"]
+    profile = await memory.fetch_profile(query)
+    assert profile is not None
+    assert profile.preferences["retention_policy"] == "30_days"
+    await memory.close()
+
+    # rows backfilled from created_at keep the same sub-second order
+    with sqlite3.connect(tmp_path / "memory.sqlite3") as conn:
+        conn.executemany(
+            """
+            INSERT INTO records (
+                session_id, user_id, consent_token, profile_embedding,
+                context_summary, retention_policy, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    session_id,
+                    "artist_backfilled",
+                    "consent",
+                    json.dumps([0.5, 0.5]),
+                    session_id,
+                    "90_days",
+                    created_at.isoformat(),
+                )
+                for session_id, created_at in (("later", later), ("earlier", earlier))
+            ],
+        )
+    conn.close()
+
+    memory = AdaptiveMemory()
+    records = await memory.list_recent(MemoryQuery(user_id="artist_backfilled", limit=10))
+    assert [record.session_id for record in records] == ["later", "earlier"]
+    await memory.close()
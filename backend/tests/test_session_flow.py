@@ -1,5 +1,13 @@
+import pytest
 from fastapi.testclient import TestClient
 
+from thenote_backend.controller.session import (
+    _SESSION_CREATED,
+    SessionController,
+    _lifecycle_event,
+)
+from thenote_backend.schemas import SessionMetadata
+
 
 def test_create_and_close_session(api_client: TestClient) -> None:
     payload = {
@@ -20,3 +28,29 @@ def test_create_and_close_session(api_client: TestClient) -> None:
     close_response = api_client.post(f"/sessions/{session_id}/close")
     assert close_response.status_code == 200
     assert close_response.json()["active"] is False
+
+
+@pytest.mark.asyncio
+async def test_closed_sessions_are_evicted_when_full() -> None:
+    controller = SessionController(max_sessions=2)
+    first = await controller.create(SessionMetadata(user_id="artist_a", intent="analytics_only"))
+    second = await controller.create(SessionMetadata(user_id="artist_b", intent="analytics_only"))
+    await controller.finalize(first.metadata.session_id)
+
+    third = await controller.create(SessionMetadata(user_id="artist_c", intent="analytics_only"))
+    assert controller.get_nowait(first.metadata.session_id) is None
+    assert controller.get_nowait(second.metadata.session_id) is second
+    assert controller.get_nowait(third.metadata.session_id) is third
+
+    # active sessions are never dropped, even past the bound
+    fourth = await controller.create(SessionMetadata(user_id="artist_d", intent="analytics_only"))
+    assert controller.get_nowait(second.metadata.session_id) is second
+    assert controller.get_nowait(fourth.metadata.session_id) is fourth
+
+
+def test_lifecycle_events_do_not_share_payloads() -> None:
+    first = _lifecycle_event(_SESSION_CREATED, "session_a")
+    first.payload["event"] = "mutated"
+    second = _lifecycle_event(_SESSION_CREATED, "session_b")
+    assert second.payload == {"event": "session_created"}
+    assert _SESSION_CREATED.payload == {"event": "session_created"}
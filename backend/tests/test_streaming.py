@@ -0,0 +1,63 @@
+import json
+
+import numpy as np
+import pytest
+
+from thenote_backend.schemas import ModuleEvent, ModuleType
+from thenote_backend.services.streaming import WebSocketStreamer
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, message: str) -> None:
+        self.messages.append(message)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_sends_one_frame_per_socket() -> None:
+    streamer = WebSocketStreamer()
+    sockets = [FakeWebSocket(), FakeWebSocket()]
+    for websocket in sockets:
+        await streamer.register("session_ws", websocket)
+
+    event = ModuleEvent(
+        session_id="session_ws",
+        source=ModuleType.SOUND_UNDERSTANDING,
+        target="broadcast",
+        payload={"level": np.float64(0.5), "count": np.int64(3)},
+    )
+    # validation only covers construction; handlers can still add non-str keys
+    event.payload[1] = 2
+    await streamer.broadcast(event)
+
+    for websocket in sockets:
+        assert len(websocket.messages) == 1
+        frame = json.loads(websocket.messages[0])
+        assert frame["session_id"] == "session_ws"
+        assert frame["source"] == ModuleType.SOUND_UNDERSTANDING.value
+        assert frame["target"] == "broadcast"
+        assert frame["payload"] == {"level": 0.5, "count": 3, "1": 2}
+    assert sockets[0].messages == sockets[1].messages
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_unserializable_payloads() -> None:
+    streamer = WebSocketStreamer()
+    websocket = FakeWebSocket()
+    await streamer.register("session_ws", websocket)
+
+    await streamer.broadcast(
+        ModuleEvent(
+            session_id="session_ws",
+            source=ModuleType.SOUND_UNDERSTANDING,
+            target="broadcast",
+            payload={"opaque": object()},
+        )
+    )
+
+    assert websocket.messages == []
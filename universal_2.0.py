@@ -15,6 +15,11 @@ import math
 from typing import Dict, List, Tuple, Optional
 import json
 
+# Golden ratio constants shared by every layer
+PHI = (1 + math.sqrt(5)) / 2
+INV_PHI = 1 / PHI
+FRACTAL_SCALES = tuple(PHI ** (-k / 4) for k in range(4))
+
 # ============================================================================
 # CORE PHYSICAL REALITY ENGINE (14-State Universal Energy Framework)
 # ============================================================================
@@ -27,7 +32,6 @@ class UniversalEnergyField(nn.Module):
     
     def __init__(self, state_weights: Optional[Dict[str, float]] = None):
         super().__init__()
-        self.PHI = (1 + math.sqrt(5)) / 2
         self.states = [
             'classical', 'cubit_classical', 'quantum', 'qubit_quantum', 
             'phantom', 'temporal', 'thermal', 'harmonic', 'vacuum', 
@@ -81,8 +85,7 @@ class UniversalEnergyField(nn.Module):
                 energy = torch.complex(x, x.roll(1, dims=0))  # Quantum superposition
             elif state == 'fractal':
                 # Fractal scaling across dimensions
-                scales = [self.PHI ** (-k/4) for k in range(4)]
-                energy = sum(s * x.roll(k, dims=1) for k, s in enumerate(scales))
+                energy = sum(s * x.roll(k, dims=1) for k, s in enumerate(FRACTAL_SCALES))
             elif state == 'toroidal':
                 # Toroidal flow - circular dimensions
                 theta = torch.atan2(x[:, 1::2], x[:, ::2])
@@ -162,12 +165,10 @@ class SacredActivation(nn.Module):
     
     def __init__(self):
         super().__init__()
-        self.phi = (1 + math.sqrt(5)) / 2
-        self.phi_conjugate = 1 / self.phi
     
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         # Fibonacci spiral activation
-        spiral = torch.sigmoid(x) * self.phi - torch.tanh(x) * self.phi_conjugate
+        spiral = torch.sigmoid(x) * PHI - torch.tanh(x) * INV_PHI
         return spiral
 
 class GoldenRatioDropout(nn.Module):
@@ -176,7 +177,6 @@ class GoldenRatioDropout(nn.Module):
     def __init__(self, p: float = 0.5):
         super().__init__()
         self.p = p
-        self.phi = (1 + math.sqrt(5)) / 2
     
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         if not self.training:
@@ -187,7 +187,7 @@ class GoldenRatioDropout(nn.Module):
         mask = torch.ones_like(x)
         
         # Preserve phi-aligned dimensions (sacred geometry pattern)
-        phi_indices = [int(dim * (self.phi ** -k) % dim) for k in range(int(math.log(dim, self.phi)))]
+        phi_indices = [int(dim * (PHI ** -k) % dim) for k in range(int(math.log(dim, PHI)))]
         for idx in phi_indices:
             if idx < dim:
                 mask[:, idx] = 1.0  # Never drop sacred dimensions
@@ -347,7 +347,6 @@ class SacredGeometricLayer(nn.Module):
     
     def __init__(self, input_dim: int, hidden_dim: int, output_dim: int):
         super().__init__()
-        self.phi = (1 + math.sqrt(5)) / 2
         
         # Fibonacci weight initialization
         self.weights = nn.Parameter(torch.Tensor(output_dim, input_dim))
@@ -362,8 +361,8 @@ class SacredGeometricLayer(nn.Module):
     
     def reset_parameters(self):
         # Golden ratio initialization
-        nn.init.normal_(self.weights, mean=self.phi, std=1/self.phi)
-        nn.init.constant_(self.bias, 1/self.phi)
+        nn.init.normal_(self.weights, mean=PHI, std=INV_PHI)
+        nn.init.constant_(self.bias, INV_PHI)
     
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         # Vesica Piscis overlap computation
@@ -456,9 +455,8 @@ class PhiAlignment(nn.Module):
     
     def __init__(self, num_classes: int):
         super().__init__()
-        self.phi = (1 + math.sqrt(5)) / 2
         self.alignment_weights = nn.Parameter(
-            torch.ones(num_classes) * self.phi
+            torch.ones(num_classes) * PHI
         )
     
     def forward(self, x: torch.Tensor) -> torch.Tensor:
@@ -497,8 +495,7 @@ class ConsciousnessCoherenceMonitor(nn.Module):
 class SixthDimension:
     """Real 6D geometric operations"""
     
-    def __init__(self):
-        self.PHI = (1 + math.sqrt(5)) / 2
+    PHI = PHI
     
     def create_6d_vector(self, x, y, z, phi, psi, omega):
         return torch.stack([x, y, z, phi, psi, omega], dim=-1)